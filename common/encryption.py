@@ -32,7 +32,12 @@ class AESCipher:
         """Applies PKCS7 padding to match AES block size."""
         return content + (self.block_size - len(content) % self.block_size) * chr(self.block_size - len(content) % self.block_size)
 
-    @staticmethod
-    def _unpad(content: str) -> str:
-        """Removes PKCS7 padding."""
-        return content[:-ord(content[len(content)-1:])]
+    def _unpad(self, content: bytes) -> bytes:
+        """Removes PKCS7 padding, raising ValueError if it is malformed."""
+        if not content or len(content) % self.block_size:
+            raise ValueError("Padded plaintext is empty or not a multiple of the block size")
+        padding_length = content[-1]
+        if not 1 <= padding_length <= self.block_size or \
+                content[-padding_length:] != bytes([padding_length]) * padding_length:
+            raise ValueError("Invalid PKCS7 padding")
+        return content[:-padding_length]
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+import argparse
+import sys
+from data_encryption.audit import audit_customers, read_bad_rows
+
+
+def print_progress(rows_checked, bad_rows):
+    print(f"\rChecked {rows_checked} rows, {bad_rows} bad", end="", flush=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Check that every encrypted customer field still decrypts")
+    parser.add_argument(
+        "database_url",
+        help="SQLAlchemy database URL, e.g. sqlite:///tempdb_<id>.db"
+    )
+    parser.add_argument("--key", default="super_secure_key")
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--checkpoint",
+        help="JSON file to record progress in and resume from"
+    )
+    parser.add_argument(
+        "--bad-rows",
+        help="JSONL file bad rows are written to "
+             "(default: <checkpoint>.bad_rows.jsonl or customer_audit_bad_rows.jsonl)"
+    )
+    parser.add_argument(
+        "--max-print",
+        type=int,
+        default=20,
+        help="how many bad rows to print (default: 20)"
+    )
+    args = parser.parse_args()
+
+    try:
+        summary = audit_customers(
+            args.database_url,
+            key=args.key,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+            checkpoint_path=args.checkpoint,
+            bad_rows_path=args.bad_rows,
+            progress=print_progress
+        )
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+    print()
+
+    if summary["already_complete"]:
+        print(
+            f"Checkpoint {args.checkpoint} is already complete; nothing was rescanned. "
+            "Delete it to audit again."
+        )
+
+    if summary["bad_row_count"]:
+        for printed, bad_row in enumerate(read_bad_rows(summary["bad_rows_path"])):
+            if printed == args.max_print:
+                print(
+                    f"... and {summary['bad_row_count'] - printed} more, "
+                    f"see {summary['bad_rows_path']}"
+                )
+                break
+            problems = "; ".join(bad_row["problems"])
+            print(f"Customer {bad_row['customer_id']}: {problems}")
+
+    print(
+        f"Checked {summary['rows_checked']} rows, "
+        f"{summary['bad_row_count']} bad, "
+        f"{summary['rows_per_second']:.0f} rows/s over {summary['elapsed']:.2f}s"
+    )
+
+    sys.exit(1 if summary["bad_row_count"] else 0)
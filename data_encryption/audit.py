@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+
+import hashlib
+import json
+import math
+import os
+import re
+import time
+from multiprocessing import Pool
+from sqlalchemy import create_engine, func, select
+from common.encryption import AESCipher
+from common.models import Customer
+
+ACCOUNT_NUMBER_PATTERN = re.compile(r"^\d{4}-\d{4}-\d{4}$")
+
+# Per-process state, set up once by _init_worker rather than per chunk.
+_engine = None
+_aes = None
+
+
+def validate_customer(aes: AESCipher, row) -> list:
+    """Decrypts every encrypted field of a customer row and returns a list of problems."""
+    problems = []
+    decrypted = {}
+
+    for field in ("name", "account_number", "balance"):
+        value = getattr(row, field)
+        if value is None:
+            problems.append((field, "missing value"))
+            continue
+        try:
+            decrypted[field] = aes.decrypt(value)
+        except ValueError as e:
+            # Covers bad Base64, bad block length, bad padding and bad UTF-8.
+            problems.append((field, f"decryption failed: {e}"))
+
+    if "name" in decrypted and not decrypted["name"].strip():
+        problems.append(("name", "empty name"))
+
+    if "account_number" in decrypted and \
+            not ACCOUNT_NUMBER_PATTERN.match(decrypted["account_number"]):
+        problems.append(("account_number", "malformed account number"))
+
+    if "balance" in decrypted:
+        try:
+            if not math.isfinite(float(decrypted["balance"])):
+                problems.append(("balance", "non-finite balance"))
+        except ValueError:
+            problems.append(("balance", "non-numeric balance"))
+
+    return problems
+
+
+def _init_worker(database_url: str, key: str):
+    global _engine, _aes
+    _engine = create_engine(database_url)
+    _aes = AESCipher(key)
+
+
+def _audit_chunk(bounds: tuple) -> tuple:
+    start_id, end_id = bounds
+    table = Customer.__table__
+    query = select(
+        table.c.customer_id,
+        table.c.name,
+        table.c.account_number,
+        table.c.balance
+    ).where(
+        table.c.customer_id >= start_id,
+        table.c.customer_id < end_id
+    )
+
+    rows_checked = 0
+    bad_rows = []
+    with _engine.connect() as connection:
+        for row in connection.execute(query):
+            rows_checked += 1
+            problems = validate_customer(_aes, row)
+            if problems:
+                bad_rows.append({
+                    "customer_id": row.customer_id,
+                    "problems": [f"{field}: {error}" for field, error in problems]
+                })
+    return end_id, rows_checked, bad_rows
+
+
+def key_fingerprint(key: str) -> str:
+    """Identifies a key in checkpoints without storing anything that decrypts data."""
+    # AESCipher uses sha256(key) as the AES key itself, so hash with a prefix.
+    return hashlib.sha256(f"customer-audit:{key}".encode()).hexdigest()
+
+
+def _load_checkpoint(
+    checkpoint_path: str,
+    database_url: str,
+    fingerprint: str,
+    bad_rows_path: str
+) -> dict:
+    if checkpoint_path and os.path.exists(checkpoint_path):
+        with open(checkpoint_path, mode="r", encoding="utf-8") as file:
+            checkpoint = json.load(file)
+        if checkpoint.get("database_url") != database_url:
+            raise ValueError(
+                f"Checkpoint {checkpoint_path} belongs to {checkpoint.get('database_url')}")
+        if checkpoint.get("key_fingerprint") != fingerprint:
+            raise ValueError(
+                f"Checkpoint {checkpoint_path} was written with a different key")
+        if checkpoint.get("bad_rows_path") != bad_rows_path:
+            raise ValueError(
+                f"Checkpoint {checkpoint_path} records bad rows in {checkpoint.get('bad_rows_path')}")
+        bad_rows_size = os.path.getsize(bad_rows_path) \
+            if os.path.exists(bad_rows_path) else 0
+        if bad_rows_size < checkpoint["bad_rows_offset"]:
+            raise ValueError(
+                f"Bad rows file {bad_rows_path} is missing or shorter than checkpoint "
+                f"{checkpoint_path} records; delete the checkpoint to audit again")
+        return checkpoint
+    return {
+        "database_url": database_url,
+        "key_fingerprint": fingerprint,
+        "bad_rows_path": bad_rows_path,
+        "bad_rows_offset": 0,
+        "next_id": None,
+        "rows_checked": 0,
+        "bad_row_count": 0
+    }
+
+
+def _save_checkpoint(checkpoint_path: str, checkpoint: dict):
+    # Write then rename, so an interrupted run never leaves a torn checkpoint.
+    temp_path = f"{checkpoint_path}.tmp"
+    with open(temp_path, mode="w", encoding="utf-8") as file:
+        json.dump(checkpoint, file)
+    os.replace(temp_path, checkpoint_path)
+
+
+def read_bad_rows(bad_rows_path: str):
+    """Yields the bad rows recorded by audit_customers, one dict at a time."""
+    with open(bad_rows_path, mode="r", encoding="utf-8") as file:
+        for line in file:
+            yield json.loads(line)
+
+
+def audit_customers(
+    database_url: str,
+    key: str = "super_secure_key",
+    chunk_size: int = 10000,
+    workers: int = None,
+    checkpoint_path: str = None,
+    bad_rows_path: str = None,
+    progress=None
+) -> dict:
+    """
+    Scans the customers table in customer_id ranges across a process pool.
+
+    Bad rows are appended to a JSONL file rather than kept in memory. Chunks
+    are consumed in order, so the checkpoint only needs the first id not yet
+    audited, the counters and how far the bad rows file got; rerunning with
+    the same checkpoint resumes from there.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size must be at least 1, got {chunk_size}")
+    if workers is not None and workers < 1:
+        raise ValueError(f"Workers must be at least 1, got {workers}")
+
+    if bad_rows_path is None:
+        bad_rows_path = f"{checkpoint_path}.bad_rows.jsonl" if checkpoint_path \
+            else "customer_audit_bad_rows.jsonl"
+    checkpoint = _load_checkpoint(
+        checkpoint_path, database_url, key_fingerprint(key), bad_rows_path)
+
+    engine = create_engine(database_url)
+    with engine.connect() as connection:
+        min_id, max_id = connection.execute(
+            select(func.min(Customer.customer_id), func.max(Customer.customer_id))
+        ).one()
+    engine.dispose()
+
+    summary = {
+        "rows_checked": checkpoint["rows_checked"],
+        "bad_row_count": checkpoint["bad_row_count"],
+        "bad_rows_path": bad_rows_path,
+        "already_complete": False,
+        "rows_per_second": 0.0,
+        "elapsed": 0.0
+    }
+
+    start_id = checkpoint["next_id"] if checkpoint["next_id"] is not None else min_id
+    if checkpoint["next_id"] is not None and (max_id is None or start_id > max_id):
+        summary["already_complete"] = True
+        return summary
+
+    # Drop anything appended after the last checkpoint; those chunks are
+    # scanned again below.
+    with open(bad_rows_path, mode="ab") as bad_rows_file:
+        bad_rows_file.truncate(checkpoint["bad_rows_offset"])
+
+    if min_id is None:
+        return summary
+
+    chunks = [
+        (chunk_start, chunk_start + chunk_size)
+        for chunk_start in range(start_id, max_id + 1, chunk_size)
+    ]
+
+    started = time.perf_counter()
+    rows_this_run = 0
+    # Binary mode, so tell() is a real byte offset to truncate back to.
+    with open(bad_rows_path, mode="ab") as bad_rows_file, \
+            Pool(workers, initializer=_init_worker, initargs=(database_url, key)) as pool:
+        for end_id, rows_checked, bad_rows in pool.imap(_audit_chunk, chunks):
+            for bad_row in bad_rows:
+                bad_rows_file.write((json.dumps(bad_row) + "\n").encode())
+            bad_rows_file.flush()
+
+            rows_this_run += rows_checked
+            checkpoint["rows_checked"] += rows_checked
+            checkpoint["bad_row_count"] += len(bad_rows)
+            checkpoint["bad_rows_offset"] = bad_rows_file.tell()
+            checkpoint["next_id"] = end_id
+            if checkpoint_path:
+                _save_checkpoint(checkpoint_path, checkpoint)
+            if progress:
+                progress(checkpoint["rows_checked"], checkpoint["bad_row_count"])
+
+    elapsed = time.perf_counter() - started
+    summary["rows_checked"] = checkpoint["rows_checked"]
+    summary["bad_row_count"] = checkpoint["bad_row_count"]
+    summary["elapsed"] = elapsed
+    summary["rows_per_second"] = rows_this_run / elapsed if elapsed else 0.0
+    return summary
@@ -0,0 +1,136 @@
+import asyncio
+import threading
+from end_to_end.pool import ConnectionPool
+
+
+class AsyncBankClient:
+    def __init__(self, host="localhost", port=9999, encrypt_packets=True, **pool_options):
+        self.pool = ConnectionPool(
+            host=host,
+            port=port,
+            encrypt_packets=encrypt_packets,
+            **pool_options
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def send_request(self, request):
+        return await self.pool.send_request(request)
+
+    async def ping(self):
+        return await self.send_request({"action": "ping"})
+
+    async def login(self, username, password):
+        return await self.send_request({
+            "action": "login",
+            "username": username,
+            "password": password
+        })
+
+    async def balance(self, customer_id):
+        return await self.send_request({
+            "action": "balance",
+            "customer_id": customer_id
+        })
+
+    async def deposit(self, customer_id, amount):
+        return await self.send_request({
+            "action": "deposit",
+            "customer_id": customer_id,
+            "amount": amount
+        })
+
+    async def withdraw(self, customer_id, amount):
+        return await self.send_request({
+            "action": "withdraw",
+            "customer_id": customer_id,
+            "amount": amount
+        })
+
+    async def close(self):
+        await self.pool.close()
+
+
+class PooledBankClient:
+    """
+    Thread-safe blocking wrapper around AsyncBankClient.
+
+    Runs the pool on a private event loop thread, so any number of caller
+    threads can share one set of connections.
+    """
+
+    def __init__(self, host="localhost", port=9999, encrypt_packets=True, **pool_options):
+        self._closed = False
+        self._pending = set()
+        self._pending_lock = threading.Lock()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="PooledBankClient", daemon=True)
+        self._thread.start()
+        self._client = self._run(self._create_client(
+            host, port, encrypt_packets, pool_options))
+
+    @staticmethod
+    async def _create_client(host, port, encrypt_packets, pool_options):
+        return AsyncBankClient(host, port, encrypt_packets, **pool_options)
+
+    def _run(self, coroutine):
+        with self._pending_lock:
+            if self._closed:
+                coroutine.close()
+                raise RuntimeError("PooledBankClient is closed")
+            future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+            self._pending.add(future)
+        try:
+            return future.result()
+        finally:
+            with self._pending_lock:
+                self._pending.discard(future)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def send_request(self, request):
+        return self._run(self._client.send_request(request))
+
+    def ping(self):
+        return self._run(self._client.ping())
+
+    def login(self, username, password):
+        return self._run(self._client.login(username, password))
+
+    def balance(self, customer_id):
+        return self._run(self._client.balance(customer_id))
+
+    def deposit(self, customer_id, amount):
+        return self._run(self._client.deposit(customer_id, amount))
+
+    def withdraw(self, customer_id, amount):
+        return self._run(self._client.withdraw(customer_id, amount))
+
+    def close(self):
+        with self._pending_lock:
+            if self._closed:
+                return
+            self._closed = True
+            pending = list(self._pending)
+
+        # Threads still blocked in _run() get CancelledError instead of
+        # waiting forever on a loop that is about to stop.
+        for future in pending:
+            future.cancel()
+
+        try:
+            asyncio.run_coroutine_threadsafe(
+                self._client.close(), self._loop).result()
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
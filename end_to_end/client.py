@@ -1,10 +1,5 @@
-import socket
-import json
 import logging
-from rich.console import Console
-from rich.prompt import Prompt, IntPrompt, FloatPrompt
-from rich.panel import Panel
-from common.encryption import AESCipher
+from end_to_end.async_client import PooledBankClient
 
 logger = logging.getLogger("BankClient")
 logging.basicConfig(
@@ -14,57 +9,62 @@ logging.basicConfig(
 
 
 class BankClient:
-    def __init__(self, host="localhost", port=9999, encrypt_packets=True):
+    def __init__(self, host="localhost", port=9999, encrypt_packets=True, **pool_options):
         self.host = host
         self.port = port
-        self.aes = AESCipher("super_secure_key")
-        self.console = Console()
+        self._console = None
         self.customer_id = None
         self.username = None
         self.name = None
         self.account_number = None
         self.encrypt_packets = encrypt_packets
+        self.pool_options = pool_options
+        self.bank = None
+
+    @property
+    def console(self):
+        # rich is only imported once the interactive UI is actually used.
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console()
+        return self._console
 
     def connect(self):
-        self.client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.disconnect()
+        self.bank = PooledBankClient(
+            self.host,
+            self.port,
+            self.encrypt_packets,
+            **self.pool_options
+        )
         try:
-            self.client_socket.connect((self.host, self.port))
+            self.bank.ping()
             return True
-        except ConnectionRefusedError:
+        except OSError:
             logger.error(
                 "Could not connect to the server. Is the server running?")
+            self.disconnect()
             return False
 
     def disconnect(self):
-        if hasattr(self, "client_socket"):
-            self.client_socket.close()
+        if self.bank is not None:
+            self.bank.close()
+            self.bank = None
 
     def send_request(self, request):
-        data = json.dumps(request)
-        if self.encrypt_packets:
-            data = self.aes.encrypt(data)
-
-        self.client_socket.send(data.encode())
-
-        data = self.client_socket.recv(4096).decode()
-
-        if self.encrypt_packets:
-            data = self.aes.decrypt(data)
-
-        return json.loads(data)
+        return self.bank.send_request(request)
 
     def login(self):
+        from rich.panel import Panel
+        from rich.prompt import Prompt
+
         self.console.print(
             Panel.fit("[bold blue]Welcome to the Secure Banking System[/bold blue]"))
 
         username = Prompt.ask("[green]Username")
         password = Prompt.ask("[green]Password", password=True)
 
-        response = self.send_request({
-            "action": "login",
-            "username": username,
-            "password": password
-        })
+        response = self.bank.login(username, password)
 
         if response.get("status") == "success":
             self.customer_id = response.get("customer_id")
@@ -82,10 +82,7 @@ class BankClient:
             return False
 
     def show_balance(self):
-        response = self.send_request({
-            "action": "balance",
-            "customer_id": self.customer_id
-        })
+        response = self.bank.balance(self.customer_id)
 
         if response.get("status") == "success":
             balance = response.get("balance")
@@ -100,13 +97,11 @@ class BankClient:
                 f"[bold red]Error: {message}[/bold red]")
 
     def deposit(self):
+        from rich.prompt import FloatPrompt
+
         amount = FloatPrompt.ask("[green]Enter deposit amount")
 
-        response = self.send_request({
-            "action": "deposit",
-            "customer_id": self.customer_id,
-            "amount": amount
-        })
+        response = self.bank.deposit(self.customer_id, amount)
 
         if response.get("status") == "success":
             message = response.get("message")
@@ -121,13 +116,11 @@ class BankClient:
                 f"[bold red]Error: {message}[/bold red]")
 
     def withdraw(self):
+        from rich.prompt import FloatPrompt
+
         amount = FloatPrompt.ask("[green]Enter withdrawal amount")
 
-        response = self.send_request({
-            "action": "withdraw",
-            "customer_id": self.customer_id,
-            "amount": amount
-        })
+        response = self.bank.withdraw(self.customer_id, amount)
 
         if response.get("status") == "success":
             message = response.get("message")
@@ -142,6 +135,9 @@ class BankClient:
                 f"[bold red]Error: {message}[/bold red]")
 
     def show_menu(self):
+        from rich.panel import Panel
+        from rich.prompt import IntPrompt
+
         while True:
             self.console.print(
                 Panel.fit("[bold blue]Banking Options[/bold blue]"))
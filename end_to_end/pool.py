@@ -0,0 +1,173 @@
+import asyncio
+import contextlib
+import json
+import logging
+import time
+from common.encryption import AESCipher
+
+logger = logging.getLogger("ConnectionPool")
+
+
+class PooledConnection:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.last_used = time.monotonic()
+
+    def is_closed(self):
+        return self.writer.is_closing() or self.reader.at_eof()
+
+    async def close(self):
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except OSError:
+            pass
+
+
+class ConnectionPool:
+    """
+    Bounded pool of asyncio connections to a BankServer.
+
+    The server handles one request at a time per socket, so every in-flight
+    request holds its own connection; `size` caps how many run concurrently.
+    """
+
+    def __init__(
+        self,
+        host="localhost",
+        port=9999,
+        size=10,
+        encrypt_packets=True,
+        health_check_interval=30.0,
+        connect_timeout=5.0,
+        request_timeout=10.0,
+        max_retries=5,
+        backoff_base=0.1,
+        backoff_max=5.0
+    ):
+        self.host = host
+        self.port = port
+        self.size = size
+        self.aes = AESCipher("super_secure_key")
+        self.encrypt_packets = encrypt_packets
+        self.health_check_interval = health_check_interval
+        self.connect_timeout = connect_timeout
+        self.request_timeout = request_timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._idle = asyncio.LifoQueue()
+        self._slots = asyncio.Semaphore(size)
+        self._connections = set()
+        self._closed = False
+
+    async def _open(self):
+        """Opens a new connection, retrying with exponential backoff."""
+        delay = self.backoff_base
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection(self.host, self.port),
+                    self.connect_timeout
+                )
+                connection = PooledConnection(reader, writer)
+                self._connections.add(connection)
+                return connection
+            except (OSError, asyncio.TimeoutError) as e:
+                if attempt == self.max_retries:
+                    raise
+                logger.warning(
+                    f"Connect attempt {attempt} to {self.host}:{self.port} "
+                    f"failed ({e}), retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.backoff_max)
+
+    async def _discard(self, connection):
+        self._connections.discard(connection)
+        await connection.close()
+
+    async def _is_healthy(self, connection):
+        """Pings connections that sat idle past the health check interval."""
+        if connection.is_closed():
+            return False
+        if time.monotonic() - connection.last_used < self.health_check_interval:
+            return True
+        try:
+            await self._exchange(connection, {"action": "ping"})
+            return True
+        except (OSError, ValueError, asyncio.TimeoutError):
+            # A ping that times out leaves a reply in flight, so the
+            # connection is unusable either way.
+            return False
+
+    async def acquire(self):
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+
+        await self._slots.acquire()
+        try:
+            while not self._idle.empty():
+                connection = self._idle.get_nowait()
+                if await self._is_healthy(connection):
+                    return connection
+                await self._discard(connection)
+            return await self._open()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def release(self, connection, discard=False):
+        try:
+            if discard or self._closed or connection.is_closed():
+                await self._discard(connection)
+            else:
+                self._idle.put_nowait(connection)
+        finally:
+            self._slots.release()
+
+    @contextlib.asynccontextmanager
+    async def connection(self):
+        connection = await self.acquire()
+        try:
+            yield connection
+        except BaseException:
+            await self.release(connection, discard=True)
+            raise
+        else:
+            await self.release(connection)
+
+    async def _exchange(self, connection, request):
+        data = json.dumps(request)
+        if self.encrypt_packets:
+            data = self.aes.encrypt(data)
+
+        connection.writer.write(data.encode())
+        await asyncio.wait_for(connection.writer.drain(), self.request_timeout)
+
+        data = (await asyncio.wait_for(
+            connection.reader.read(4096), self.request_timeout)).decode()
+        if not data:
+            raise ConnectionResetError("Server closed the connection")
+
+        if self.encrypt_packets:
+            data = self.aes.decrypt(data)
+
+        connection.last_used = time.monotonic()
+        return json.loads(data)
+
+    async def send_request(self, request):
+        # Requests are not retried on a fresh connection: a deposit or
+        # withdrawal may already have been applied when the socket dropped
+        # or timed out. Any failure, timeouts included, discards the
+        # connection via connection().
+        async with self.connection() as connection:
+            return await self._exchange(connection, request)
+
+    async def close(self):
+        self._closed = True
+        while not self._idle.empty():
+            self._idle.get_nowait()
+        for connection in list(self._connections):
+            await self._discard(connection)
@@ -75,9 +75,15 @@ class BankServer:
             session.close()
 
         self.client_handlers = []
+        self.ready = threading.Event()
+        # Balances are encrypted, so updates are a read-modify-write in Python;
+        # serialize them per customer to avoid lost updates. Customers share
+        # a fixed set of striped locks so the lock table cannot grow.
+        self.balance_locks = [threading.Lock() for _ in range(64)]
 
     def start(self):
         self.server_socket.listen(5)
+        self.ready.set()
         logger.info(f"Server started on {self.host}:{self.port}")
 
         try:
@@ -130,9 +136,23 @@ class BankServer:
             return self.handle_withdraw(request)
         elif action == "balance":
             return self.handle_balance(request)
+        elif action == "ping":
+            return {"status": "success"}
         else:
             return {"status": "error", "message": "Invalid action"}
 
+    @staticmethod
+    def parse_customer_id(customer_id):
+        """Returns customer_id as an int, or None if it is not a valid id."""
+        # Normalized up front so 1, "1" and "01" share a lock and a query.
+        try:
+            return int(str(customer_id))
+        except ValueError:
+            return None
+
+    def customer_lock(self, customer_id: int):
+        return self.balance_locks[customer_id % len(self.balance_locks)]
+
     def handle_login(self, request):
         logger.info(
             f"Received login request: {request}")
@@ -158,30 +178,34 @@ class BankServer:
             session.close()
 
     def handle_deposit(self, request):
-        customer_id = request.get("customer_id")
+        customer_id = self.parse_customer_id(request.get("customer_id"))
         amount = float(request.get("amount", 0))
 
+        if customer_id is None:
+            return {"status": "error", "message": "Invalid customer ID"}
+
         if amount <= 0:
             return {"status": "error", "message": "Invalid deposit amount"}
 
         session = self.Session()
         try:
-            customer = session.query(Customer).filter_by(
-                customer_id=customer_id).first()
-            if not customer:
-                return {"status": "error", "message": "Customer not found"}
-
-            current_balance = float(self.aes.decrypt(customer.balance))
-            new_balance = current_balance + amount
-            customer.balance = self.aes.encrypt(str(new_balance))
-
-            transaction = Transaction(
-                customer_id=customer_id,
-                transaction_type=TransactionType.DEPOSIT,
-                amount=amount
-            )
-            session.add(transaction)
-            session.commit()
+            with self.customer_lock(customer_id):
+                customer = session.query(Customer).filter_by(
+                    customer_id=customer_id).first()
+                if not customer:
+                    return {"status": "error", "message": "Customer not found"}
+
+                current_balance = float(self.aes.decrypt(customer.balance))
+                new_balance = current_balance + amount
+                customer.balance = self.aes.encrypt(str(new_balance))
+
+                transaction = Transaction(
+                    customer_id=customer_id,
+                    transaction_type=TransactionType.DEPOSIT,
+                    amount=amount
+                )
+                session.add(transaction)
+                session.commit()
 
             return {
                 "status": "success",
@@ -196,33 +220,37 @@ class BankServer:
             session.close()
 
     def handle_withdraw(self, request):
-        customer_id = request.get("customer_id")
+        customer_id = self.parse_customer_id(request.get("customer_id"))
         amount = float(request.get("amount", 0))
 
+        if customer_id is None:
+            return {"status": "error", "message": "Invalid customer ID"}
+
         if amount <= 0:
             return {"status": "error", "message": "Invalid withdrawal amount"}
 
         session = self.Session()
         try:
-            customer = session.query(Customer).filter_by(
-                customer_id=customer_id).first()
-            if not customer:
-                return {"status": "error", "message": "Customer not found"}
-
-            current_balance = float(self.aes.decrypt(customer.balance))
-            if current_balance < amount:
-                return {"status": "error", "message": "Insufficient funds"}
-
-            new_balance = current_balance - amount
-            customer.balance = self.aes.encrypt(str(new_balance))
-
-            transaction = Transaction(
-                customer_id=customer_id,
-                transaction_type=TransactionType.WITHDRAWAL,
-                amount=amount
-            )
-            session.add(transaction)
-            session.commit()
+            with self.customer_lock(customer_id):
+                customer = session.query(Customer).filter_by(
+                    customer_id=customer_id).first()
+                if not customer:
+                    return {"status": "error", "message": "Customer not found"}
+
+                current_balance = float(self.aes.decrypt(customer.balance))
+                if current_balance < amount:
+                    return {"status": "error", "message": "Insufficient funds"}
+
+                new_balance = current_balance - amount
+                customer.balance = self.aes.encrypt(str(new_balance))
+
+                transaction = Transaction(
+                    customer_id=customer_id,
+                    transaction_type=TransactionType.WITHDRAWAL,
+                    amount=amount
+                )
+                session.add(transaction)
+                session.commit()
 
             return {
                 "status": "success",
@@ -237,7 +265,9 @@ class BankServer:
             session.close()
 
     def handle_balance(self, request):
-        customer_id = request.get("customer_id")
+        customer_id = self.parse_customer_id(request.get("customer_id"))
+        if customer_id is None:
+            return {"status": "error", "message": "Invalid customer ID"}
 
         session = self.Session()
         try:
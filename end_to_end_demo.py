@@ -1,4 +1,3 @@
-import time
 import threading
 import logging
 from end_to_end.server import BankServer
@@ -15,7 +14,10 @@ encrypt_packets = True
 
 def run_server():
     server = BankServer(encrypt_packets=encrypt_packets)
-    server.start()
+    server_thread = threading.Thread(target=server.start)
+    server_thread.daemon = True
+    server_thread.start()
+    return server
 
 
 def run_client():
@@ -33,11 +35,11 @@ def run_client():
 
 
 if __name__ == "__main__":
-    server_thread = threading.Thread(target=run_server)
-    server_thread.daemon = True
-    server_thread.start()
+    server = run_server()
 
-    time.sleep(1)
+    if not server.ready.wait(timeout=5):
+        logger.error("Server did not become ready")
+        raise SystemExit(1)
 
     try:
         run_client()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+
+import argparse
+import threading
+from end_to_end.server import BankServer
+
+
+def announce_ready(server):
+    # Printed once the socket is listening, so a supervisor or test harness
+    # can wait for this line instead of sleeping.
+    server.ready.wait()
+    print(f"READY {server.host}:{server.port}", flush=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the bank server headless")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=9999)
+    parser.add_argument(
+        "--no-encrypt",
+        action="store_true",
+        help="send packets unencrypted"
+    )
+    args = parser.parse_args()
+
+    server = BankServer(
+        host=args.host,
+        port=args.port,
+        encrypt_packets=not args.no_encrypt
+    )
+
+    ready_thread = threading.Thread(target=announce_ready, args=(server,))
+    ready_thread.daemon = True
+    ready_thread.start()
+
+    try:
+        server.start()
+    finally:
+        server.cleanup()